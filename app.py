@@ -1,12 +1,19 @@
+import gc
 import streamlit as st
-import time
 from typing import List
 
 from config.settings import settings
 from src.loader import load_documents, get_document_info
 from src.splitter import split_documents, get_chunk_info
-from src.vector_store import build_vector_store, get_retriever
-from src.rag_chain import run_rag
+from src.vector_store import (
+    build_vector_store,
+    get_source_key,
+    load_vector_store,
+    save_vector_store,
+    search_by_vector
+)
+from src.rag_chain import stream_rag
+from src.semantic_cache import SemanticAnswerCache, get_query_embeddings
 import os
 from dotenv import load_dotenv
 
@@ -86,6 +93,9 @@ def init_session_state():
     if "doc_info" not in st.session_state:
         st.session_state.doc_info = None
     
+    if "answer_cache" not in st.session_state:
+        st.session_state.answer_cache = SemanticAnswerCache()
+    
     if "file_uploader_key" not in st.session_state:
         st.session_state.file_uploader_key = 0
     
@@ -95,6 +105,7 @@ def init_session_state():
 # Initialize session state
 init_session_state()
 
+
 # Sidebar
 with st.sidebar:
     st.header("📁 Data Source")
@@ -122,13 +133,16 @@ with st.sidebar:
     
     # New document button
     if st.button("🔄 Start New Document", use_container_width=True):
-        st.session_state.vector_store = None
-        st.session_state.chat_history = []
+        # Drop references to the old index so its memory can be reclaimed;
+        # init_session_state() recreates the keys on rerun
+        for key in ("vector_store", "doc_info", "chat_history", "answer_cache"):
+            st.session_state.pop(key, None)
+        gc.collect()
+        
         st.session_state.upload_key += 1
         st.session_state.file_uploader_key += 1
         st.session_state.url_input_key += 1
         st.session_state.document_loaded = False
-        st.session_state.doc_info = None
         st.rerun()
     
     # Show document info if loaded
@@ -189,42 +203,57 @@ if question:
                 # Build vector store if not already done
                 if st.session_state.vector_store is None:
                     with st.spinner("📚 Loading and processing documents..."):
-                        # Load documents
-                        docs = load_documents(
-                            files=uploaded_files if has_files else None,
-                            url=url.strip() if has_url else None
-                        )
-                        
-                        doc_info = get_document_info(docs)
+                        source_files = uploaded_files if has_files else None
+                        source_url = url.strip() if has_url else None
                         
-                        # Split into chunks
-                        chunks = split_documents(docs)
-                        chunk_info = get_chunk_info(chunks)
+                        # Reuse the index if these exact files were processed before;
+                        # URLs are always re-fetched since pages change
+                        cache_key = get_source_key(source_files) if source_files else None
+                        cached = load_vector_store(cache_key) if cache_key else None
                         
-                        # Store combined info
-                        st.session_state.doc_info = {**doc_info, **chunk_info}
+                        if cached is not None:
+                            st.session_state.vector_store, st.session_state.doc_info = cached
+                        else:
+                            # Load documents
+                            docs = load_documents(files=source_files, url=source_url)
+                            
+                            doc_info = get_document_info(docs)
+                            
+                            # Split into chunks
+                            chunks = split_documents(docs)
+                            chunk_info = get_chunk_info(chunks)
+                            
+                            # Store combined info
+                            st.session_state.doc_info = {**doc_info, **chunk_info}
+                            
+                            # Build vector store
+                            st.session_state.vector_store = build_vector_store(chunks)
+                            if cache_key:
+                                save_vector_store(
+                                    st.session_state.vector_store,
+                                    cache_key,
+                                    st.session_state.doc_info
+                                )
                         
-                        # Build vector store
-                        st.session_state.vector_store = build_vector_store(chunks)
                         st.session_state.document_loaded = True
                 
-                # Retrieve relevant documents
-                retriever = get_retriever(st.session_state.vector_store)
-                relevant_docs = retriever.invoke(question)
-                
-                # Generate answer
-                answer = run_rag(question, relevant_docs)
-                
-                # Simulate streaming effect
-                streamed_text = ""
-                words = answer.split()
+                # Reuse the answer of a near-identical earlier question
+                query_vector = get_query_embeddings().embed_query(question)
+                answer = st.session_state.answer_cache.lookup(query_vector)
                 
-                for i, word in enumerate(words):
-                    streamed_text += word + " "
-                    response_placeholder.markdown(streamed_text + "▌")
-                    time.sleep(0.03)  # Adjust speed as needed
+                if answer is None:
+                    # Retrieve relevant documents with the embedding computed above
+                    relevant_docs = search_by_vector(st.session_state.vector_store, query_vector)
+                    
+                    # Stream the answer as the LLM generates it; a failed stream
+                    # raises into the handler below, so it is never cached
+                    answer = response_placeholder.write_stream(
+                        stream_rag(question, relevant_docs)
+                    ).strip()
+                    
+                    st.session_state.answer_cache.add(query_vector, answer)
                 
-                # Final response without cursor
+                # Final response
                 response_placeholder.markdown(answer)
                 
             except Exception as e:
@@ -15,6 +15,7 @@ class Settings:
         "https://openrouter.ai/api/v1"
     )
     USER_AGENT: str = os.getenv("USER_AGENT", "rag-openrouter-app/1.0")
+    URL_TIMEOUT: float = float(os.getenv("URL_TIMEOUT", "10"))  # Seconds per web request
     
     # Free models available on OpenRouter
     # For main LLM (text generation)
@@ -33,15 +34,32 @@ class Settings:
     # Document Processing Settings
     CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "500"))
     CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "100"))
+    SPLITTER: str = os.getenv("SPLITTER", "recursive")  # recursive | regex | semantic
     
     # Retriever Settings
     RETRIEVER_K: int = int(os.getenv("RETRIEVER_K", "4"))  # Number of documents to retrieve
     
+    # HNSW Index Settings
+    HNSW_M: int = int(os.getenv("HNSW_M", "32"))  # Graph neighbors per node
+    HNSW_EF_CONSTRUCTION: int = int(os.getenv("HNSW_EF_CONSTRUCTION", "80"))
+    HNSW_EF_SEARCH: int = int(os.getenv("HNSW_EF_SEARCH", "64"))  # Higher = better recall, slower search
+    INDEX_QUANTIZATION: str = os.getenv("INDEX_QUANTIZATION", "fp16")  # none | fp16 | 8bit
+    
+    # Semantic Cache Settings
+    SEMANTIC_CACHE_SIZE: int = int(os.getenv("SEMANTIC_CACHE_SIZE", "256"))  # Cached answers per document
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))  # Min cosine similarity for a hit
+    
     # Embedding Model (Local - HuggingFace)
     EMBEDDING_MODEL: str = os.getenv(
         "EMBEDDING_MODEL",
         "sentence-transformers/all-MiniLM-L6-v2"
     )
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "auto")  # auto | onnx | huggingface
+    EMBEDDING_ONNX_FILE: str = os.getenv("EMBEDDING_ONNX_FILE", "")  # Empty = known INT8 file for the model
+    EMBEDDING_DEVICE: str = os.getenv("EMBEDDING_DEVICE", "")  # Empty = autodetect cuda/mps/cpu
+    
+    # Local cache directory (embeddings, indexes)
+    CACHE_DIR: str = os.getenv("CACHE_DIR", ".cache")
     
     # Streamlit Configuration
     PAGE_TITLE: str = "RAG Document Assistant"
@@ -0,0 +1,86 @@
+"""
+Docstore module.
+SQLite-backed chunk storage so persisted indexes keep chunk text on
+disk instead of in a pickled in-memory dict.
+"""
+import json
+import sqlite3
+import threading
+from typing import Dict, List, Union
+
+from langchain_core.documents import Document
+from langchain_community.docstore.base import AddableMixin, Docstore
+
+
+class SQLiteDocstore(Docstore, AddableMixin):
+    """
+    Docstore keeping chunk text and metadata in a SQLite table.
+
+    Only the chunks returned by a search are read into memory. The store
+    lives in Streamlit session state and each rerun executes on a new
+    thread, so the connection is opened with check_same_thread=False and
+    access is serialized with a lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS docs "
+            "(id TEXT PRIMARY KEY, content TEXT, metadata TEXT)"
+        )
+
+    @staticmethod
+    def _to_document(content: str, metadata: str) -> Document:
+        return Document(page_content=content, metadata=json.loads(metadata))
+
+    def add(self, texts: Dict[str, Document]) -> None:
+        """
+        Add documents keyed by docstore id.
+
+        Args:
+            texts: Mapping of id to document
+        """
+        rows = [
+            (doc_id, doc.page_content, json.dumps(doc.metadata, default=str))
+            for doc_id, doc in texts.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO docs (id, content, metadata) VALUES (?, ?, ?)",
+                rows
+            )
+
+    def delete(self, ids: List) -> None:
+        """
+        Delete documents by id.
+
+        Args:
+            ids: Docstore ids to remove
+        """
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM docs WHERE id = ?", [(i,) for i in ids])
+
+    def search(self, search: str) -> Union[str, Document]:
+        """
+        Look up a single document by id.
+
+        Args:
+            search: Docstore id
+
+        Returns:
+            Union[str, Document]: Document, or a not-found message
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, metadata FROM docs WHERE id = ?", (search,)
+            ).fetchone()
+        if row is None:
+            return f"ID {search} not found."
+        return self._to_document(*row)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
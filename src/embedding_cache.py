@@ -0,0 +1,96 @@
+"""
+Embedding cache module.
+Persists chunk embeddings on disk so re-ingesting the same content
+skips the embedding model entirely.
+"""
+import hashlib
+import os
+import sqlite3
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from config.settings import settings
+from src.embeddings import get_embeddings, get_embedding_dimension, get_model_id
+
+
+# SQLite limits the number of bound parameters per statement
+_SELECT_BATCH = 500
+
+
+def _db_path() -> str:
+    """Return the path of the embedding cache database, creating its directory."""
+    cache_dir = os.path.join(settings.CACHE_DIR, "embeddings")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "embeddings.sqlite")
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database and make sure the table exists."""
+    conn = sqlite3.connect(_db_path())
+    conn.execute("CREATE TABLE IF NOT EXISTS emb (key BLOB PRIMARY KEY, vec BLOB)")
+    return conn
+
+
+def _cache_key(text: str, model_name: str) -> bytes:
+    """Content-addressed key: SHA-256 of model name plus chunk text."""
+    return hashlib.sha256((model_name + text).encode("utf-8")).digest()
+
+
+def get_or_compute(
+    texts: List[str],
+    embeddings: Embeddings = None
+) -> np.ndarray:
+    """
+    Return embeddings for texts, computing only those not already cached.
+
+    A hit skips tokenization as well as the forward pass, so token ids
+    are not cached separately; misses are tokenized once per batch.
+
+    Args:
+        texts: Chunk texts to embed
+        embeddings: Embedding model to use for cache misses (default from get_embeddings)
+
+    Returns:
+        np.ndarray: float32 matrix of shape (len(texts), dimension)
+    """
+    if embeddings is None:
+        embeddings = get_embeddings()
+
+    if not texts:
+        return np.empty((0, get_embedding_dimension()), dtype=np.float32)
+
+    model_id = get_model_id()
+    keys = [_cache_key(text, model_id) for text in texts]
+    cached = {}
+
+    with _connect() as conn:
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), _SELECT_BATCH):
+            batch = unique_keys[start:start + _SELECT_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT key, vec FROM emb WHERE key IN ({placeholders})",
+                batch
+            )
+            for key, vec in rows:
+                cached[key] = np.frombuffer(vec, dtype=np.float32)
+
+        # Embed each missing text once, even if it appears several times
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = embeddings.embed_documents(list(missing.values()))
+            rows = []
+            for key, vec in zip(missing, vectors):
+                arr = np.asarray(vec, dtype=np.float32)
+                cached[key] = arr
+                rows.append((key, arr.tobytes()))
+            conn.executemany("INSERT OR IGNORE INTO emb (key, vec) VALUES (?, ?)", rows)
+
+    conn.close()
+
+    return np.vstack([cached[key] for key in keys])
@@ -1,15 +1,132 @@
+import importlib.util
+from functools import lru_cache
+
+import torch
+from langchain_core.embeddings import Embeddings
 from langchain_huggingface import HuggingFaceEmbeddings
 from config.settings import settings
 
 
-def get_embeddings() -> HuggingFaceEmbeddings:
+# Dynamically quantized INT8 ONNX exports published in the model repos.
+# The AVX2 (uint8) variant runs on any x86-64 CPU; repos also ship
+# onnx/model_qint8_avx512_vnni.onnx for CPUs with AVX512-VNNI.
+_INT8_ONNX_FILES = {
+    "sentence-transformers/all-MiniLM-L6-v2": "onnx/model_quint8_avx2.onnx",
+}
+
+
+def _onnx_runtime_available() -> bool:
+    """Check for the packages sentence-transformers needs for backend="onnx"."""
+    return all(
+        importlib.util.find_spec(name) is not None
+        for name in ("onnxruntime", "optimum")
+    )
+
+
+def get_onnx_file(model_name: str) -> str:
+    """
+    Return the INT8 ONNX file to load for a model, or "" if none is known.
+
+    Set EMBEDDING_ONNX_FILE to use a different file or another model.
+    """
+    return settings.EMBEDDING_ONNX_FILE or _INT8_ONNX_FILES.get(model_name, "")
+
+
+def get_device() -> str:
+    """
+    Pick the fastest available torch device: CUDA, then Apple MPS, then CPU.
+
+    Set EMBEDDING_DEVICE to override the detection.
+    """
+    if settings.EMBEDDING_DEVICE:
+        return settings.EMBEDDING_DEVICE
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def get_backend() -> str:
+    """
+    Resolve which embedding backend to use.
+
+    "auto" uses the INT8 ONNX export via ONNX Runtime on CPU when the
+    runtime is installed and a quantized file is known for the model,
+    and the FP32 torch model otherwise (e.g. on GPU).
+    """
+    backend = settings.EMBEDDING_BACKEND
+    if backend == "auto":
+        if (get_device() == "cpu"
+                and _onnx_runtime_available()
+                and get_onnx_file(settings.EMBEDDING_MODEL)):
+            return "onnx"
+        return "huggingface"
+    if backend == "onnx":
+        if not _onnx_runtime_available():
+            raise ImportError("EMBEDDING_BACKEND=onnx requires 'sentence-transformers[onnx]'")
+        if not get_onnx_file(settings.EMBEDDING_MODEL):
+            raise ValueError(
+                f"No INT8 ONNX file known for {settings.EMBEDDING_MODEL}; set EMBEDDING_ONNX_FILE"
+            )
+    return backend
+
+
+@lru_cache(maxsize=1)
+def _load_embeddings(model_name: str, backend: str) -> Embeddings:
+    """
+    Load the embedding model once per process.
+
+    Keyed on the model name and backend so switching either still
+    loads the right model instead of returning a stale one.
+    """
+    device = get_device()
+    model_kwargs = {'device': device}
+
+    if backend == "onnx":
+        # INT8 weights run through ONNX Runtime's integer matmul kernels
+        model_kwargs['backend'] = 'onnx'
+        model_kwargs['model_kwargs'] = {'file_name': get_onnx_file(model_name)}
 
     return HuggingFaceEmbeddings(
-        model_name=settings.EMBEDDING_MODEL,
-        model_kwargs={'device': 'cpu'},  
-        encode_kwargs={'normalize_embeddings': True}  
+        model_name=model_name,
+        model_kwargs=model_kwargs,
+        encode_kwargs={
+            'normalize_embeddings': True,
+            'batch_size': 64 if device == 'cpu' else 128
+        }
     )
 
 
+def get_model_id() -> str:
+    """
+    Identify the exact weights in use, for keying cached vectors and indexes.
+
+    Backends (and ONNX files) produce slightly different vectors, so they
+    are part of the id.
+    """
+    backend = get_backend()
+    model_id = f"{backend}:{settings.EMBEDDING_MODEL}"
+    if backend == "onnx":
+        model_id += f":{get_onnx_file(settings.EMBEDDING_MODEL)}"
+    return model_id
+
+
+def get_embeddings() -> Embeddings:
+
+    return _load_embeddings(settings.EMBEDDING_MODEL, get_backend())
+
+
+@lru_cache(maxsize=4)
+def _embedding_dimension(model_name: str, backend: str) -> int:
+    return len(_load_embeddings(model_name, backend).embed_query("dimension probe"))
+
+
 def get_embedding_dimension() -> int:
-    return 384 
\ No newline at end of file
+    """
+    Return the vector size of the configured model.
+
+    Measured once per model from a probe embedding, so models other than
+    384-d MiniLM (e.g. 768-d mpnet or bge-base) work unchanged.
+    """
+    return _embedding_dimension(settings.EMBEDDING_MODEL, get_backend())
\ No newline at end of file
@@ -3,14 +3,44 @@ Document loading module.
 Handles loading documents from various sources: PDF, TXT files, and URLs.
 """
 import os
+import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
 from langchain_core.documents import Document
 from langchain_community.document_loaders import (
-    PyPDFLoader,
+    PyPDFium2Loader,
     TextLoader,
     WebBaseLoader
 )
+from config.settings import settings
+
+try:
+    import trafilatura
+except ImportError:  # Optional: falls back to WebBaseLoader + BeautifulSoup
+    trafilatura = None
+
+
+# Upper bound on concurrent file loads (temp writes and text parsing;
+# PDF parsing is serialized by _PDFIUM_LOCK)
+MAX_LOAD_WORKERS = 8
+
+# pdfium is not thread-safe. Newer langchain-community releases lock inside
+# PyPDFium2Parser, but the 0.2.x parsers allowed by requirements.txt do not
+_PDFIUM_LOCK = threading.Lock()
+
+# Uploads are copied to disk in chunks of this size, never as one buffer
+COPY_CHUNK_SIZE = 1 << 20  # 1 MB
+
+# Shared HTTP session so repeated URL loads reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=MAX_LOAD_WORKERS))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=MAX_LOAD_WORKERS))
+_SESSION.headers["User-Agent"] = settings.USER_AGENT
 
 
 def load_documents(
@@ -54,6 +84,10 @@ def _load_from_files(files: List) -> List[Document]:
     """
     Load documents from uploaded files.
     
+    Files are loaded on a thread pool; results keep the upload order.
+    Temp-file writes and TXT parsing overlap, but pdfium is not
+    thread-safe, so PDFs are parsed one at a time under _PDFIUM_LOCK.
+    
     Args:
         files: List of file objects from Streamlit uploader
         
@@ -62,44 +96,67 @@ def _load_from_files(files: List) -> List[Document]:
     """
     docs: List[Document] = []
     
-    for file in files:
-        try:
-            # Get file extension
-            suffix = os.path.splitext(file.name)[1].lower()
-            
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                tmp.write(file.getbuffer())
-                temp_path = tmp.name
-            
-            # Load based on file type
-            if suffix == ".pdf":
-                loader = PyPDFLoader(temp_path)
-                docs.extend(loader.load())
-            elif suffix == ".txt":
-                loader = TextLoader(temp_path, encoding="utf-8")
-                docs.extend(loader.load())
-            else:
-                print(f"Unsupported file type: {suffix}")
-                continue
-            
-            # Clean up temporary file
+    with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(files))) as pool:
+        for file_docs in pool.map(_load_one_file, files):
+            docs.extend(file_docs)
+    
+    return docs
+
+
+def _load_one_file(file) -> List[Document]:
+    """
+    Load documents from a single uploaded file.
+    
+    Args:
+        file: File object from Streamlit uploader
+        
+    Returns:
+        List[Document]: Loaded documents (empty on failure)
+    """
+    temp_path = None
+    
+    try:
+        # Get file extension
+        suffix = os.path.splitext(file.name)[1].lower()
+        
+        if suffix not in (".pdf", ".txt"):
+            print(f"Unsupported file type: {suffix}")
+            return []
+        
+        # Stream upload to a temporary file in fixed-size chunks
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            file.seek(0)
+            shutil.copyfileobj(file, tmp, length=COPY_CHUNK_SIZE)
+            temp_path = tmp.name
+        
+        # Load based on file type
+        if suffix == ".pdf":
+            with _PDFIUM_LOCK:
+                return PyPDFium2Loader(temp_path).load()
+        
+        return TextLoader(temp_path, encoding="utf-8").load()
+        
+    except Exception as e:
+        print(f"Error loading file {file.name}: {str(e)}")
+        return []
+    
+    finally:
+        # Clean up temporary file
+        if temp_path:
             try:
                 os.unlink(temp_path)
             except Exception:
                 pass  # Ignore cleanup errors
-                
-        except Exception as e:
-            print(f"Error loading file {file.name}: {str(e)}")
-            continue
-    
-    return docs
 
 
 def _load_from_url(url: str) -> List[Document]:
     """
     Load documents from a web URL.
     
+    Uses trafilatura to extract the main article text when it is
+    installed, otherwise WebBaseLoader with the lxml parser. Requests
+    are bounded by URL_TIMEOUT so a slow site cannot hang the app.
+    
     Args:
         url: Web URL to scrape
         
@@ -107,13 +164,46 @@ def _load_from_url(url: str) -> List[Document]:
         List[Document]: Loaded documents
     """
     try:
-        loader = WebBaseLoader(url)
+        if trafilatura is not None:
+            docs = _extract_with_trafilatura(url)
+            if docs:
+                return docs
+        
+        loader = WebBaseLoader(
+            url,
+            session=_SESSION,
+            default_parser="lxml",  # C parser instead of html.parser
+            requests_kwargs={"timeout": settings.URL_TIMEOUT},
+            raise_for_status=True
+        )
         return loader.load()
     except Exception as e:
         print(f"Error loading URL {url}: {str(e)}")
         return []
 
 
+def _extract_with_trafilatura(url: str) -> List[Document]:
+    """
+    Fetch a page and extract its main content with trafilatura.
+    
+    Args:
+        url: Web URL to scrape
+        
+    Returns:
+        List[Document]: One document, or empty if nothing was extracted
+    """
+    response = _SESSION.get(url, timeout=settings.URL_TIMEOUT)
+    response.raise_for_status()
+    
+    # Pass raw bytes so trafilatura detects the charset itself; response.text
+    # falls back to ISO-8859-1 when the server omits it and garbles UTF-8
+    text = trafilatura.extract(response.content, url=url, include_comments=False)
+    if not text:
+        return []
+    
+    return [Document(page_content=text, metadata={"source": url})]
+
+
 def get_document_info(docs: List[Document]) -> dict:
     """
     Get summary information about loaded documents.
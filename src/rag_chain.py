@@ -3,7 +3,8 @@ RAG (Retrieval-Augmented Generation) chain module.
 Combines retrieved documents with LLM to generate answers.
 Uses OpenRouter's free models for cost-effective operation.
 """
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List
 from langchain_core.documents import Document
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
@@ -29,17 +30,35 @@ Response format:
 - Keep the explanation clear and professional.
 """
 
+# Parsed once at import; only context/question are filled in per call
+PROMPT = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT),
+    ("human", """Context:
+{context}
 
-def get_llm() -> ChatOpenAI:
+Question: {question}
+
+Please provide a clear and accurate answer based only on the context above.""")
+])
+
+# Maximum tokens in a generated answer
+MAX_TOKENS = 200
+
+
+@lru_cache(maxsize=4)
+def _cached_llm(model: str, temperature: float, max_tokens: int) -> ChatOpenAI:
     """
-    Create and configure the LLM instance using OpenRouter.
+    Build a ChatOpenAI client once per configuration.
+    
+    Reusing the client keeps its HTTP connection pool warm, so later
+    questions skip the TLS handshake with OpenRouter.
     """
     return ChatOpenAI(
-        model=settings.LLM_MODEL,
+        model=model,
         api_key=settings.OPENROUTER_API_KEY,  # Fixed parameter name
         base_url=settings.OPENROUTER_BASE_URL,  # Fixed parameter name
-        temperature=settings.LLM_TEMPERATURE,
-        max_tokens=200,
+        temperature=temperature,
+        max_tokens=max_tokens,
         default_headers={
             "HTTP-Referer": "https://github.com/yourusername/rag-app",
             "X-Title": "RAG Document Assistant"
@@ -47,37 +66,40 @@ def get_llm() -> ChatOpenAI:
     )
 
 
+def get_llm() -> ChatOpenAI:
+    """
+    Create and configure the LLM instance using OpenRouter.
+    """
+    return _cached_llm(settings.LLM_MODEL, settings.LLM_TEMPERATURE, MAX_TOKENS)
+
+
 def format_context(docs: List[Document]) -> str:
     if not docs:
         return "No relevant context found."
     
-    context_parts = []
-    for i, doc in enumerate(docs, 1):
-        # Add document with separator
-        context_parts.append(f"--- Document {i} ---")
-        context_parts.append(doc.page_content.strip())
-        context_parts.append("")  # Empty line between documents
-    
-    return "\n".join(context_parts)
+    # Single join over a generator: no intermediate list of parts
+    return "\n\n".join(
+        f"--- Document {i} ---\n{doc.page_content.strip()}"
+        for i, doc in enumerate(docs, 1)
+    )
 
 
-def run_rag(question: str, docs: List[Document]) -> str:
-    context = format_context(docs)
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", SYSTEM_PROMPT),
-        ("human", """Context:
-{context}
+@lru_cache(maxsize=4)
+def _cached_chain(model: str, temperature: float, max_tokens: int):
+    # Create the chain: prompt -> LLM -> output parser
+    return PROMPT | _cached_llm(model, temperature, max_tokens) | StrOutputParser()
 
-Question: {question}
 
-Please provide a clear and accurate answer based only on the context above.""")
-    ])
-    
-    # Get LLM instance
-    llm = get_llm()
-    
-    # Create the chain: prompt -> LLM -> output parser
-    chain = prompt | llm | StrOutputParser()
+def get_chain():
+    """
+    Return the shared prompt -> LLM -> output parser chain.
+    """
+    return _cached_chain(settings.LLM_MODEL, settings.LLM_TEMPERATURE, MAX_TOKENS)
+
+
+def run_rag(question: str, docs: List[Document]) -> str:
+    context = format_context(docs)
+    chain = get_chain()
     
     # Execute the chain
     try:
@@ -90,6 +112,31 @@ Please provide a clear and accurate answer based only on the context above.""")
         return f"Error generating answer: {str(e)}\n\nPlease check your OpenRouter API key and try again."
 
 
+def stream_rag(question: str, docs: List[Document]) -> Iterator[str]:
+    """
+    Stream the answer token by token as the LLM produces it.
+    
+    Args:
+        question: User question
+        docs: Retrieved context documents
+        
+    Yields:
+        str: Answer text chunks
+        
+    Raises:
+        Exception: If the LLM call fails, possibly after some chunks were
+            yielded; errors are not sent as text so callers never mistake
+            a failed answer for a real one
+    """
+    context = format_context(docs)
+    chain = get_chain()
+    
+    yield from chain.stream({
+        "context": context,
+        "question": question
+    })
+
+
 def run_rag_with_sources(question: str, docs: List[Document]) -> dict:
     answer = run_rag(question, docs)
     
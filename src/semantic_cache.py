@@ -0,0 +1,129 @@
+"""
+Semantic cache module.
+Caches query embeddings and answers so repeated or near-identical
+questions skip the embedding model and the LLM call.
+"""
+from functools import lru_cache
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from config.settings import settings
+from src.embeddings import get_backend, get_embeddings
+
+
+class QueryEmbeddingCache(Embeddings):
+    """
+    Embeddings wrapper with an exact-match LRU cache on embed_query.
+
+    Document embedding is delegated unchanged; only queries are cached,
+    since the same question string is typically embedded several times.
+    """
+
+    def __init__(self, embeddings: Embeddings, maxsize: int = 512):
+        self._embeddings = embeddings
+        self._embed_query = lru_cache(maxsize=maxsize)(self._compute_query)
+
+    def _compute_query(self, text: str) -> tuple:
+        return tuple(self._embeddings.embed_query(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        # Return a fresh list so callers cannot mutate the cached value
+        return list(self._embed_query(text))
+
+
+class SemanticAnswerCache:
+    """
+    Cosine-similarity cache mapping query embeddings to answers.
+
+    Entries live in a fixed-size ring buffer (FIFO eviction). Vectors are
+    normalized on the way in, so one matrix-vector product gives cosine
+    similarity against every entry.
+    """
+
+    def __init__(
+        self,
+        dimension: int = None,
+        capacity: int = None,
+        threshold: float = None
+    ):
+        if capacity is None:
+            capacity = settings.SEMANTIC_CACHE_SIZE
+        if threshold is None:
+            threshold = settings.SEMANTIC_CACHE_THRESHOLD
+
+        self.capacity = capacity
+        self.threshold = threshold
+        # Without an explicit dimension, sized from the first stored vector
+        self.emb_matrix = (
+            None if dimension is None
+            else np.zeros((capacity, dimension), dtype=np.float32)
+        )
+        self._sims = np.empty(capacity, dtype=np.float32)  # Reused lookup buffer
+        self.answers: List[Optional[str]] = [None] * capacity
+        self._size = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32)
+        return v / max(float(np.linalg.norm(v)), 1e-12)
+
+    def lookup(self, query_vector: List[float]) -> Optional[str]:
+        """
+        Return the cached answer for the most similar query, if close enough.
+
+        Args:
+            query_vector: Embedding of the question
+
+        Returns:
+            Optional[str]: Cached answer, or None on a miss
+        """
+        if self._size == 0:
+            return None
+
+        sims = self._sims[:self._size]
+        np.dot(self.emb_matrix[:self._size], self._normalize(query_vector), out=sims)
+        idx = int(np.argmax(sims))
+
+        if sims[idx] >= self.threshold:
+            return self.answers[idx]
+        return None
+
+    def add(self, query_vector: List[float], answer: str) -> None:
+        """
+        Store an answer, overwriting the oldest entry when full.
+
+        Args:
+            query_vector: Embedding of the question
+            answer: Answer generated for that question
+        """
+        vector = self._normalize(query_vector)
+        if self.emb_matrix is None:
+            self.emb_matrix = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+        self.emb_matrix[self._next] = vector
+        self.answers[self._next] = answer
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        self.answers = [None] * self.capacity
+        self._size = 0
+        self._next = 0
+
+
+@lru_cache(maxsize=1)
+def _load_query_embeddings(model_name: str, backend: str) -> QueryEmbeddingCache:
+    return QueryEmbeddingCache(get_embeddings())
+
+
+def get_query_embeddings() -> QueryEmbeddingCache:
+    """Return the shared query-embedding cache for the configured model."""
+    return _load_query_embeddings(settings.EMBEDDING_MODEL, get_backend())
@@ -2,20 +2,152 @@
 Document splitting module.
 Splits large documents into smaller chunks for better retrieval and processing.
 """
+import re
 from typing import List
+
+import numpy as np
 from langchain_core.documents import Document
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_text_splitters import RecursiveCharacterTextSplitter, TextSplitter
 from config.settings import settings
+from src.embeddings import get_embeddings
+
+try:
+    from langchain_experimental.text_splitter import SemanticChunker
+except ImportError:  # Optional: only needed for SPLITTER=semantic
+    SemanticChunker = None
+
+
+# Same separators as the recursive splitter, compiled into one pattern
+_SEPARATOR_RE = re.compile(r"(\n\n|\n|\. | )")
+_SEPARATOR_RANK = {"\n\n": 3, "\n": 2, ". ": 1, " ": 0}
+
+
+def _regex_split(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """
+    Split text into chunks of at most chunk_size characters in one pass.
+    
+    Each chunk ends at the strongest separator (paragraph > line >
+    sentence > word) in its back half, and starts with up to
+    chunk_overlap characters carried over from the previous chunk.
+    """
+    # Tokens with their trailing separator, in one C-level regex pass
+    parts = _SEPARATOR_RE.split(text)
+    pieces: List[str] = []
+    ranks: List[int] = []
+    for i in range(0, len(parts), 2):
+        separator = parts[i + 1] if i + 1 < len(parts) else ""
+        piece = parts[i] + separator
+        # Hard-split runs longer than a chunk (no separator inside)
+        while len(piece) > chunk_size:
+            pieces.append(piece[:chunk_size])
+            ranks.append(-1)
+            piece = piece[chunk_size:]
+        if piece:
+            pieces.append(piece)
+            ranks.append(_SEPARATOR_RANK.get(separator, -1))
+    
+    chunks: List[str] = []
+    current: List[int] = []
+    length = 0
+    n_overlap = 0
+    
+    for idx, piece in enumerate(pieces):
+        while current and length + len(piece) > chunk_size:
+            # Cut at the strongest separator in the back half of the chunk
+            best, best_rank, emitted_len = len(current), -2, 0
+            for j, i in enumerate(current, 1):
+                emitted_len += len(pieces[i])
+                if j <= n_overlap or emitted_len < length // 2:
+                    continue
+                if ranks[i] >= best_rank:
+                    best, best_rank = j, ranks[i]
+            
+            emitted, rest = current[:best], current[best:]
+            chunk = "".join(pieces[i] for i in emitted).strip()
+            if chunk:
+                chunks.append(chunk)
+            
+            rest_len = sum(len(pieces[i]) for i in rest)
+            keep: List[int] = []
+            keep_len = 0
+            for i in reversed(emitted):
+                size = len(pieces[i])
+                if (keep_len + size > chunk_overlap
+                        or keep_len + size + rest_len + len(piece) > chunk_size):
+                    break
+                keep.append(i)
+                keep_len += size
+            
+            current = keep[::-1] + rest
+            length = keep_len + rest_len
+            n_overlap = len(keep)
+        
+        current.append(idx)
+        length += len(piece)
+    
+    chunk = "".join(pieces[i] for i in current).strip()
+    if chunk and (not chunks or n_overlap < len(current)):
+        chunks.append(chunk)
+    return chunks
+
+
+class RegexTextSplitter(TextSplitter):
+    """
+    Single-pass splitter using a pre-compiled separator regex.
+    
+    Faster than RecursiveCharacterTextSplitter on large documents since
+    the text is tokenized once in C instead of re-split per separator.
+    """
+    
+    def split_text(self, text: str) -> List[str]:
+        return _regex_split(text, self._chunk_size, self._chunk_overlap)
+
+
+def _get_splitter():
+    """
+    Create the splitter selected by the SPLITTER setting.
+    
+    Returns:
+        Splitter with a split_documents method
+        
+    Raises:
+        ValueError: If SPLITTER is not a known type
+        ImportError: If SPLITTER=semantic without langchain-experimental
+    """
+    if settings.SPLITTER == "recursive":
+        return RecursiveCharacterTextSplitter(
+            chunk_size=settings.CHUNK_SIZE,
+            chunk_overlap=settings.CHUNK_OVERLAP,
+            length_function=len,
+            separators=["\n\n", "\n", ". ", " ", ""],  # Try these in order
+            is_separator_regex=False
+        )
+    
+    if settings.SPLITTER == "regex":
+        return RegexTextSplitter(
+            chunk_size=settings.CHUNK_SIZE,
+            chunk_overlap=settings.CHUNK_OVERLAP
+        )
+    
+    if settings.SPLITTER == "semantic":
+        if SemanticChunker is None:
+            raise ImportError("SPLITTER=semantic requires the 'langchain-experimental' package")
+        return SemanticChunker(get_embeddings(), breakpoint_threshold_type="percentile")
+    
+    raise ValueError(
+        f"Unknown SPLITTER '{settings.SPLITTER}'. Use one of: recursive, regex, semantic"
+    )
 
 
 def split_documents(docs: List[Document]) -> List[Document]:
     """
     Split documents into smaller chunks for processing.
     
-    Uses RecursiveCharacterTextSplitter which:
-    - Tries to keep paragraphs, sentences, and words together
-    - Splits on multiple separators in order of preference
-    - Maintains context with overlap between chunks
+    Uses the splitter selected by SPLITTER (default: recursive):
+    - recursive: RecursiveCharacterTextSplitter, keeps paragraphs,
+      sentences, and words together with overlap between chunks
+    - regex: same separators and overlap in a single regex pass
+    - semantic: SemanticChunker, breaks where embeddings shift topic
     
     Args:
         docs: List of documents to split
@@ -23,13 +155,7 @@ def split_documents(docs: List[Document]) -> List[Document]:
     Returns:
         List[Document]: List of document chunks
     """
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=settings.CHUNK_SIZE,
-        chunk_overlap=settings.CHUNK_OVERLAP,
-        length_function=len,
-        separators=["\n\n", "\n", ". ", " ", ""],  # Try these in order
-        is_separator_regex=False
-    )
+    splitter = _get_splitter()
     
     chunks = splitter.split_documents(docs)
     
@@ -59,11 +185,15 @@ def get_chunk_info(chunks: List[Document]) -> dict:
             "max_chunk_size": 0
         }
     
-    chunk_sizes = [len(chunk.page_content) for chunk in chunks]
+    chunk_sizes = np.fromiter(
+        (len(chunk.page_content) for chunk in chunks),
+        dtype=np.int64,
+        count=len(chunks)
+    )
     
     return {
-        "total_chunks": len(chunks),
-        "avg_chunk_size": sum(chunk_sizes) // len(chunk_sizes),
-        "min_chunk_size": min(chunk_sizes),
-        "max_chunk_size": max(chunk_sizes)
+        "total_chunks": int(chunk_sizes.size),
+        "avg_chunk_size": int(chunk_sizes.mean()),
+        "min_chunk_size": int(chunk_sizes.min()),
+        "max_chunk_size": int(chunk_sizes.max())
     }
\ No newline at end of file
@@ -2,15 +2,95 @@
 Vector store module.
 Manages the FAISS vector database for semantic search.
 """
-from typing import List
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from typing import List, Optional, Tuple
+
+import faiss
+import numpy as np
 from langchain_core.documents import Document
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_core.vectorstores import VectorStoreRetriever
-from src.embeddings import get_embeddings
+from src.docstore import SQLiteDocstore
+from src.embeddings import get_embeddings, get_model_id
+from src.embedding_cache import get_or_compute
+from src.semantic_cache import get_query_embeddings
 from config.settings import settings
 
 
-def build_vector_store(chunks: List[Document]) -> FAISS:
+# Bump when the on-disk cache layout changes so old entries are ignored
+_CACHE_FORMAT = 2
+
+# Memory-map index data on load where FAISS supports it. Only builds with
+# IO_FLAG_MMAP_IFC can map the HNSW/SQ vector codes; otherwise IO_FLAG_MMAP
+# only covers IVF lists and this index is read fully into RAM
+_MMAP_FLAGS = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+
+# FAISS scalar quantizer types for INDEX_QUANTIZATION
+_QUANTIZERS = {
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+    "8bit": faiss.ScalarQuantizer.QT_8bit,
+}
+
+
+def _build_index(vectors: np.ndarray) -> faiss.Index:
+    """
+    Build an HNSW graph index over normalized vectors.
+    
+    HNSW gives roughly logarithmic search time instead of the flat
+    index's brute-force scan, with near-exact recall at small k.
+    Inner product is used since embeddings are normalized (= cosine).
+    Vectors are stored scalar-quantized (fp16 by default) to cut memory,
+    and added with sequential int64 ids via IndexIDMap2 so each search
+    hit maps straight to its docstore id.
+    
+    Args:
+        vectors: float32 matrix of shape (n, dimension)
+        
+    Returns:
+        faiss.Index: Populated HNSW index wrapped in an IndexIDMap2
+        
+    Raises:
+        ValueError: If INDEX_QUANTIZATION is not a known type
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    dimension = vectors.shape[1]  # Whatever the configured model produces
+    quantization = settings.INDEX_QUANTIZATION
+    
+    if quantization == "none":
+        index = faiss.IndexHNSWFlat(dimension, settings.HNSW_M, faiss.METRIC_INNER_PRODUCT)
+    elif quantization in _QUANTIZERS:
+        index = faiss.IndexHNSWSQ(
+            dimension,
+            _QUANTIZERS[quantization],
+            settings.HNSW_M,
+            faiss.METRIC_INNER_PRODUCT
+        )
+    else:
+        raise ValueError(
+            f"Unknown INDEX_QUANTIZATION '{quantization}'. "
+            f"Use one of: none, {', '.join(_QUANTIZERS)}"
+        )
+    
+    index.hnsw.efConstruction = settings.HNSW_EF_CONSTRUCTION
+    index.hnsw.efSearch = settings.HNSW_EF_SEARCH
+    
+    id_index = faiss.IndexIDMap2(index)
+    
+    id_index.train(vectors)  # Learns quantizer ranges; no-op for a flat index
+    id_index.add_with_ids(vectors, np.arange(len(vectors), dtype=np.int64))
+    return id_index
+
+
+def build_vector_store(
+    chunks: List[Document],
+    vectors: Optional[np.ndarray] = None
+) -> FAISS:
     """
     Build a FAISS vector store from document chunks.
     
@@ -20,29 +100,176 @@ def build_vector_store(chunks: List[Document]) -> FAISS:
     - Supports millions of vectors
     - Free and open-source
     
+    Each chunk is encoded at most once: vectors come from the embedding
+    cache (or the caller) and go straight into the index, so FAISS never
+    re-embeds documents itself.
+    
     Args:
         chunks: List of document chunks to index
+        vectors: Pre-computed embeddings, one row per chunk (computed if omitted)
         
     Returns:
         FAISS: Configured vector store instance
         
     Raises:
-        ValueError: If chunks list is empty
+        ValueError: If chunks list is empty or vectors do not match chunks
     """
     if not chunks:
         raise ValueError("Cannot build vector store from empty chunks list")
     
-    embeddings = get_embeddings()
+    if vectors is None:
+        # Reuse cached vectors; only new chunks go through the model
+        texts = [chunk.page_content for chunk in chunks]
+        vectors = get_or_compute(texts, get_embeddings())
+    elif len(vectors) != len(chunks):
+        raise ValueError(
+            f"Got {len(vectors)} vectors for {len(chunks)} chunks"
+        )
     
-    # Create FAISS index from documents
-    vector_store = FAISS.from_documents(
-        documents=chunks,
-        embedding=embeddings
+    index = _build_index(vectors)
+    
+    # Docstore ids are the FAISS ids as strings
+    ids = [str(i) for i in range(len(chunks))]
+    docstore = InMemoryDocstore(dict(zip(ids, chunks)))
+    
+    # Wrap the index so retrieval still goes through the LangChain API
+    vector_store = FAISS(
+        embedding_function=get_query_embeddings(),  # Caches repeated query embeddings
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=dict(enumerate(ids)),
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
     )
     
     return vector_store
 
 
+def get_source_key(files: List) -> str:
+    """
+    Compute a content hash identifying a set of uploaded files.
+    
+    Includes the embedding, chunking and index build settings (quantization,
+    HNSW_M, HNSW_EF_CONSTRUCTION), so changing any of them never returns an
+    index built with different parameters. HNSW_EF_SEARCH is a search-time
+    setting and is re-applied on load instead. Each file
+    is framed by its name and length so different splits of the same bytes
+    never collide.
+    
+    URL sources are deliberately not keyed: a page can change at any time,
+    and re-fetching it is the only way to notice. Their chunk embeddings
+    are still reused through the embedding cache.
+    
+    Args:
+        files: List of uploaded file objects
+        
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        f"{get_model_id()}:"
+        f"{settings.SPLITTER}:{settings.CHUNK_SIZE}:{settings.CHUNK_OVERLAP}:"
+        f"{settings.INDEX_QUANTIZATION}:{settings.HNSW_M}:{settings.HNSW_EF_CONSTRUCTION}:"
+        f"{_CACHE_FORMAT}".encode("utf-8")
+    )
+    
+    for file in files:
+        # getbuffer() is a zero-copy view of the upload, not a second copy
+        data = file.getbuffer()
+        name = file.name.encode("utf-8")
+        digest.update(f"{len(name)}:".encode("utf-8") + name + f"{data.nbytes}:".encode("utf-8"))
+        digest.update(data)
+    
+    return digest.hexdigest()
+
+
+def _index_dir(key: str) -> str:
+    return os.path.join(settings.CACHE_DIR, "faiss", key)
+
+
+def save_vector_store(
+    vector_store: FAISS,
+    key: str,
+    info: Optional[dict] = None
+) -> None:
+    """
+    Persist a vector store (and optional document info) to the disk cache.
+    
+    Written to a temporary directory and renamed, so a concurrent reader
+    never sees a half-written index.
+    
+    Args:
+        vector_store: FAISS vector store instance
+        key: Source key from get_source_key
+        info: Document statistics to restore alongside the index
+    """
+    final_dir = _index_dir(key)
+    tmp_dir = f"{final_dir}.tmp-{uuid.uuid4().hex}"
+    os.makedirs(tmp_dir)
+    
+    faiss.write_index(vector_store.index, os.path.join(tmp_dir, "index.faiss"))
+    
+    # Chunk text goes to SQLite instead of a pickle
+    docstore = SQLiteDocstore(os.path.join(tmp_dir, "docstore.sqlite"))
+    docstore.add({
+        doc_id: vector_store.docstore.search(doc_id)
+        for doc_id in vector_store.index_to_docstore_id.values()
+    })
+    docstore.close()
+    
+    with open(os.path.join(tmp_dir, "info.json"), "w", encoding="utf-8") as f:
+        json.dump(info or {}, f)
+    
+    try:
+        os.replace(tmp_dir, final_dir)
+    except OSError:
+        # Another session cached the same source first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def load_vector_store(key: str) -> Optional[Tuple[FAISS, dict]]:
+    """
+    Load a cached vector store for a source key.
+    
+    Chunks are read from SQLite on demand, so chunk text never has to fit
+    in RAM. The vectors are only memory-mapped on faiss builds that have
+    IO_FLAG_MMAP_IFC; older builds allowed by requirements.txt (e.g.
+    faiss-cpu 1.7.x) read the whole HNSW index into memory.
+    
+    Args:
+        key: Source key from get_source_key
+        
+    Returns:
+        Optional[Tuple[FAISS, dict]]: Vector store and document info, or None on a miss
+    """
+    index_dir = _index_dir(key)
+    index_path = os.path.join(index_dir, "index.faiss")
+    docstore_path = os.path.join(index_dir, "docstore.sqlite")
+    if not (os.path.exists(index_path) and os.path.exists(docstore_path)):
+        return None
+    
+    index = faiss.read_index(index_path, _MMAP_FLAGS)
+    
+    # efSearch is saved in the file; use the current setting instead
+    faiss.downcast_index(index.index).hnsw.efSearch = settings.HNSW_EF_SEARCH
+    
+    vector_store = FAISS(
+        embedding_function=get_query_embeddings(),
+        index=index,
+        docstore=SQLiteDocstore(docstore_path),
+        index_to_docstore_id={i: str(i) for i in range(index.ntotal)},
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+    )
+    
+    info_path = os.path.join(index_dir, "info.json")
+    info = {}
+    if os.path.exists(info_path):
+        with open(info_path, encoding="utf-8") as f:
+            info = json.load(f)
+    
+    return vector_store, info
+
+
 def get_retriever(
     vector_store: FAISS,
     k: int = None
@@ -88,6 +315,28 @@ def search_similar_docs(
     return vector_store.similarity_search(query, k=k)
 
 
+def search_by_vector(
+    vector_store: FAISS,
+    embedding: List[float],
+    k: int = None
+) -> List[Document]:
+    """
+    Search for similar documents using an already computed query embedding.
+    
+    Args:
+        vector_store: FAISS vector store instance
+        embedding: Query embedding
+        k: Number of results to return (default from settings)
+        
+    Returns:
+        List[Document]: Most similar documents
+    """
+    if k is None:
+        k = settings.RETRIEVER_K
+    
+    return vector_store.similarity_search_by_vector(embedding, k=k)
+
+
 def search_with_scores(
     vector_store: FAISS,
     query: str,